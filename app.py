@@ -4,6 +4,8 @@ A Streamlit app that scores writing quality and fights content convergence.
 """
 
 import streamlit as st
+import random
+import re
 import sys
 from pathlib import Path
 
@@ -13,6 +15,113 @@ sys.path.append(str(Path(__file__).parent))
 from utils.text_processor import TextAnalyzer
 from components.metrics import score_gauge, score_breakdown, overall_grade
 
+# Sample texts for the "Load Example" button
+_EXAMPLES = (
+    "We need to leverage our core competencies to create synergy and move the needle on this game-changing initiative.",
+    "The data shows that 73% of users abandoned the checkout process at the payment step, suggesting a friction point we need to address.",
+    "I think that maybe we should probably consider looking into possibly implementing some sort of solution at some point."
+)
+
+# Annotated samples for the Examples page
+_EXAMPLE_ANALYSES = (
+    {
+        "title": "Corporate Jargon",
+        "text": "We need to leverage our core competencies to create synergy and move the needle on this game-changing initiative that will disrupt the industry.",
+        "expected": "Low Originality"
+    },
+    {
+        "title": "Data-Driven",
+        "text": "Our Q3 analysis reveals that 73% of users abandoned the checkout process at the payment step (n=1,240). This suggests a friction point costing approximately $2.4M in annual revenue.",
+        "expected": "High Evidence"
+    },
+    {
+        "title": "Hedging Language",
+        "text": "I think that maybe we should probably consider looking into possibly implementing some sort of solution at some point in the future, if that's okay.",
+        "expected": "Low Voice"
+    }
+)
+
+# Sidebar brand header
+_SIDEBAR_HEADER_HTML = """
+        <div style="padding: 1rem 0; border-bottom: 1px solid rgba(148, 163, 184, 0.2); margin-bottom: 1rem;">
+            <h1 style="margin: 0; font-size: 1.5rem; background: linear-gradient(135deg, #6366f1 0%, #06b6d4 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">⚡ Dnt Be Average</h1>
+            <p style="color: #64748b; font-size: 0.875rem; margin: 0.5rem 0 0 0;">Break the convergence</p>
+        </div>
+    """
+
+# Analyze page hero
+_HERO_HTML = """
+            <h1 class="main-header" style="margin-bottom: 0.5rem;">
+                Escape the<br>
+                <span style="background: linear-gradient(135deg, #f43f5e 0%, #f59e0b 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">Average</span>
+            </h1>
+            <p class="sub-header">
+                LLMs converge to the mean. Your writing shouldn't. 
+                <br>Get scored on originality, evidence, clarity, and voice.
+            </p>
+        """
+
+# Analyze page quote card
+_QUOTE_HTML = """
+            <div style="
+                background: rgba(30, 41, 59, 0.6);
+                border-radius: 12px;
+                padding: 1rem;
+                border: 1px solid rgba(99, 102, 241, 0.3);
+            ">
+                <p style="color: #94a3b8; font-size: 0.875rem; margin: 0 0 0.5rem 0; font-style: italic;">
+                    "Mathematically, repeated averaging converges toward the mean. Original thought becomes statistically rare."
+                </p>
+            </div>
+        """
+
+# Results placeholder shown before the first analysis
+_EMPTY_STATE_HTML = """
+                <div style="
+                    background: rgba(30, 41, 59, 0.4);
+                    border: 2px dashed rgba(148, 163, 184, 0.2);
+                    border-radius: 16px;
+                    padding: 3rem 2rem;
+                    text-align: center;
+                    color: #64748b;
+                ">
+                    <div style="font-size: 3rem; margin-bottom: 1rem;">📊</div>
+                    <p style="font-size: 1.1rem; margin-bottom: 0.5rem;">Results will appear here</p>
+                    <p style="font-size: 0.875rem;">Enter your text and click Analyze to see your scores</p>
+                </div>
+            """
+
+# About page body
+_ABOUT_HTML = """
+        <h1 class="main-header">About Dnt Be Average</h1>
+        <div style="max-width: 800px;">
+            <h3 style="color: #6366f1;">The Problem</h3>
+            <p style="color: #cbd5e1; line-height: 1.7;">
+                Large Language Models are trained on billions of texts and predict the most probable next word. 
+                Mathematically, this creates a convergence toward the mean. When everyone uses AI-generated content, 
+                the world drifts toward an "average of averages"—where original thought becomes statistically rare.
+            </p>
+
+            <h3 style="color: #6366f1; margin-top: 2rem;">The Solution</h3>
+            <p style="color: #cbd5e1; line-height: 1.7;">
+                This tool scores your writing on four dimensions that resist convergence:
+            </p>
+            <ul style="color: #cbd5e1; line-height: 1.8;">
+                <li><strong>Originality:</strong> Avoidance of clichés and generic phrases</li>
+                <li><strong>Evidence:</strong> Specific data, examples, and citations</li>
+                <li><strong>Clarity:</strong> Readable structure without unnecessary complexity</li>
+                <li><strong>Voice:</strong> Confidence and distinctive personality</li>
+            </ul>
+
+            <h3 style="color: #6366f1; margin-top: 2rem;">Methodology</h3>
+            <p style="color: #cbd5e1; line-height: 1.7;">
+                The analyzer uses pattern matching for cliché detection, readability metrics for clarity, 
+                and linguistic analysis for voice strength. It runs entirely in your browser (no text is stored 
+                on any server) and is built with Python and Streamlit.
+            </p>
+        </div>
+    """
+
 # Page configuration
 st.set_page_config(
     page_title="Dnt Be Average | Writing Quality Analyzer",
@@ -22,30 +131,83 @@ st.set_page_config(
 )
 
 # Load custom CSS
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_WHITESPACE = re.compile(r'\s+')
+
+@st.cache_data
+def _read_css(path: str) -> str:
+    """Read the stylesheet once, stripped of comments and redundant whitespace"""
+    css_file = Path(path)
+    if not css_file.exists():
+        return ""
+    css = _CSS_COMMENT.sub('', css_file.read_text())
+    return _WHITESPACE.sub(' ', css).strip()
+
 def load_css():
     css_file = Path(__file__).parent / "assets" / "custom.css"
-    if css_file.exists():
-        with open(css_file) as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+    css = _read_css(str(css_file))
+    if css:
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
 
 load_css()
 
+@st.cache_resource
+def get_analyzer():
+    """Build the analyzer once per server process and share it across sessions"""
+    return TextAnalyzer()
+
+@st.cache_data(max_entries=256, ttl=3600, show_spinner=False)
+def _analyze(text: str, mode: str):
+    """Analyze text, sharing results for repeated (text, mode) pairs across sessions"""
+    return get_analyzer().analyze(text)
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _render_highlights(text: str, spans: tuple) -> str:
+    """Render highlight HTML only when the highlighted view is shown"""
+    return get_analyzer().highlight_text(text, spans)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _top_unique(items: tuple, k: int = 10) -> list:
+    """First k distinct items, in the order they were found"""
+    return list(dict.fromkeys(items))[:k]
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _build_report(scores: tuple, n_cliches: int, n_weak: int, suggestions: tuple, text_head: str) -> bytes:
+    """Render the downloadable plain-text report, encoded once per analysis"""
+    overall, originality, evidence, clarity, voice = scores
+    # Short texts leave evidence and clarity unscored
+    evidence = "N/A" if evidence is None else f"{evidence}/100"
+    clarity = "N/A" if clarity is None else f"{clarity}/100"
+    report = f"""
+DNT BE AVERAGE - ANALYSIS REPORT
+================================
+Overall Score: {overall}/100
+Originality: {originality}/100
+Evidence: {evidence}
+Clarity: {clarity}
+Voice: {voice}/100
+
+Issues Found:
+- Clichés: {n_cliches}
+- Weak Claims: {n_weak}
+
+Suggestions:
+{chr(10).join(['• ' + s for s in suggestions])}
+
+Analyzed Text:
+{text_head}...
+            """
+    return report.encode("utf-8")
+
 # Initialize session state
-if 'analyzer' not in st.session_state:
-    st.session_state.analyzer = TextAnalyzer()
-if 'analysis_result' not in st.session_state:
-    st.session_state.analysis_result = None
+if 'analyzed_text' not in st.session_state:
+    st.session_state.analyzed_text = None
 if 'text_input' not in st.session_state:
     st.session_state.text_input = ""
 
 # Sidebar Navigation
 with st.sidebar:
-    st.markdown("""
-        <div style="padding: 1rem 0; border-bottom: 1px solid rgba(148, 163, 184, 0.2); margin-bottom: 1rem;">
-            <h1 style="margin: 0; font-size: 1.5rem; background: linear-gradient(135deg, #6366f1 0%, #06b6d4 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">⚡ Dnt Be Average</h1>
-            <p style="color: #64748b; font-size: 0.875rem; margin: 0.5rem 0 0 0;">Break the convergence</p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_SIDEBAR_HEADER_HTML, unsafe_allow_html=True)
 
     st.markdown("### Navigation")
     page = st.radio("", ["📝 Analyze", "📚 Examples", "ℹ️ About"], label_visibility="collapsed")
@@ -68,40 +230,9 @@ with st.sidebar:
     st.markdown("---")
     st.markdown("<div style='color: #64748b; font-size: 0.75rem;'>v2.0 • Built with Streamlit</div>", unsafe_allow_html=True)
 
-# Main Content Area
-if page == "📝 Analyze":
-    # Hero Section
-    col1, col2 = st.columns([2, 1], gap="large")
-
-    with col1:
-        st.markdown("""
-            <h1 class="main-header" style="margin-bottom: 0.5rem;">
-                Escape the<br>
-                <span style="background: linear-gradient(135deg, #f43f5e 0%, #f59e0b 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">Average</span>
-            </h1>
-            <p class="sub-header">
-                LLMs converge to the mean. Your writing shouldn't. 
-                <br>Get scored on originality, evidence, clarity, and voice.
-            </p>
-        """, unsafe_allow_html=True)
-
-    with col2:
-        # Quick stats or quote
-        st.markdown("""
-            <div style="
-                background: rgba(30, 41, 59, 0.6);
-                border-radius: 12px;
-                padding: 1rem;
-                border: 1px solid rgba(99, 102, 241, 0.3);
-            ">
-                <p style="color: #94a3b8; font-size: 0.875rem; margin: 0 0 0.5rem 0; font-style: italic;">
-                    "Mathematically, repeated averaging converges toward the mean. Original thought becomes statistically rare."
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
-
-    st.markdown("---")
-
+# Analyze page body: input, results and detailed tabs rerun on their own
+@st.fragment
+def _analyze_fragment(analysis_mode: str, show_highlighting: bool, auto_analyze: bool):
     # Input Section
     input_col, results_col = st.columns([1, 1], gap="large")
 
@@ -112,19 +243,13 @@ if page == "📝 Analyze":
         toolbar_cols = st.columns([1, 1, 1, 2])
         with toolbar_cols[0]:
             if st.button("🎲 Load Example", use_container_width=True):
-                examples = [
-                    "We need to leverage our core competencies to create synergy and move the needle on this game-changing initiative.",
-                    "The data shows that 73% of users abandoned the checkout process at the payment step, suggesting a friction point we need to address.",
-                    "I think that maybe we should probably consider looking into possibly implementing some sort of solution at some point."
-                ]
-                import random
-                st.session_state.text_input = random.choice(examples)
+                st.session_state.text_input = random.choice(_EXAMPLES)
                 st.rerun()
 
         with toolbar_cols[1]:
             if st.button("🗑️ Clear", use_container_width=True):
                 st.session_state.text_input = ""
-                st.session_state.analysis_result = None
+                st.session_state.analyzed_text = None
                 st.rerun()
 
         with toolbar_cols[2]:
@@ -160,14 +285,27 @@ if page == "📝 Analyze":
         if analyze_disabled:
             st.warning("⚠️ Enter at least 20 characters to analyze")
 
+        # Auto-analyze only reruns the analysis once the text has changed;
+        # repeats of an earlier text are served from the cache
+        result = None
+        if auto_analyze and not analyze_disabled and text_input != st.session_state.analyzed_text:
+            result = _analyze(text_input, analysis_mode)
+            st.session_state.analyzed_text = text_input
+
         if st.button("⚡ Analyze Writing", type="primary", disabled=analyze_disabled, use_container_width=True):
             with st.spinner("🔍 Analyzing your text..."):
-                st.session_state.analysis_result = st.session_state.analyzer.analyze(text_input)
+                result = _analyze(text_input, analysis_mode)
+                st.session_state.analyzed_text = text_input
+
+    # The session only remembers which text was analyzed; when nothing was
+    # analyzed on this rerun the result comes from the shared cache
+    analyzed_text = st.session_state.analyzed_text
+    if result is None and analyzed_text:
+        result = _analyze(analyzed_text, analysis_mode)
 
     # Results Section
     with results_col:
-        if st.session_state.analysis_result:
-            result = st.session_state.analysis_result
+        if result:
 
             st.markdown("### 📊 Analysis Results")
 
@@ -187,24 +325,10 @@ if page == "📝 Analyze":
 
         else:
             # Empty state
-            st.markdown("""
-                <div style="
-                    background: rgba(30, 41, 59, 0.4);
-                    border: 2px dashed rgba(148, 163, 184, 0.2);
-                    border-radius: 16px;
-                    padding: 3rem 2rem;
-                    text-align: center;
-                    color: #64748b;
-                ">
-                    <div style="font-size: 3rem; margin-bottom: 1rem;">📊</div>
-                    <p style="font-size: 1.1rem; margin-bottom: 0.5rem;">Results will appear here</p>
-                    <p style="font-size: 0.875rem;">Enter your text and click Analyze to see your scores</p>
-                </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_EMPTY_STATE_HTML, unsafe_allow_html=True)
 
     # Detailed Results (Full Width)
-    if st.session_state.analysis_result:
-        result = st.session_state.analysis_result
+    if result:
 
         st.markdown("---")
         st.markdown("### 🔍 Detailed Analysis")
@@ -217,7 +341,7 @@ if page == "📝 Analyze":
             with issues_col1:
                 st.markdown("#### Clichés Detected")
                 if result.clichés:
-                    unique_clichés = list(set([c['text'] for c in result.clichés]))[:10]
+                    unique_clichés = _top_unique(tuple(c.text for c in result.clichés))
                     for cliché in unique_clichés:
                         st.markdown(f"""
                             <span class="cliche-tag">{cliché}</span>
@@ -230,7 +354,7 @@ if page == "📝 Analyze":
             with issues_col2:
                 st.markdown("#### Weak Claims")
                 if result.weak_claims:
-                    unique_weak = list(set([w['text'] for w in result.weak_claims]))[:10]
+                    unique_weak = _top_unique(tuple(w.text for w in result.weak_claims))
                     for claim in unique_weak:
                         st.markdown(f"""
                             <div style="
@@ -277,7 +401,7 @@ if page == "📝 Analyze":
                         font-size: 1rem;
                         color: #e2e8f0;
                     ">
-                        {result.highlighted_text}
+                        {_render_highlights(analyzed_text, result.highlight_spans)}
                     </div>
                 """, unsafe_allow_html=True)
             else:
@@ -288,25 +412,14 @@ if page == "📝 Analyze":
         export_col1, export_col2, export_col3 = st.columns([1, 1, 2])
 
         with export_col1:
-            report_data = f"""
-DNT BE AVERAGE - ANALYSIS REPORT
-================================
-Overall Score: {result.overall_score}/100
-Originality: {result.originality_score}/100
-Evidence: {result.evidence_score}/100
-Clarity: {result.clarity_score}/100
-Voice: {result.voice_score}/100
-
-Issues Found:
-- Clichés: {len(result.clichés)}
-- Weak Claims: {len(result.weak_claims)}
-
-Suggestions:
-{chr(10).join(['• ' + s for s in result.suggestions])}
-
-Analyzed Text:
-{text_input[:500]}...
-            """
+            report_data = _build_report(
+                (result.overall_score, result.originality_score, result.evidence_score,
+                 result.clarity_score, result.voice_score),
+                len(result.clichés),
+                len(result.weak_claims),
+                result.suggestions,
+                analyzed_text[:500]
+            )
             st.download_button(
                 label="📥 Download Report",
                 data=report_data,
@@ -315,65 +428,36 @@ Analyzed Text:
                 use_container_width=True
             )
 
+
+# Main Content Area
+if page == "📝 Analyze":
+    # Hero Section
+    col1, col2 = st.columns([2, 1], gap="large")
+
+    with col1:
+        st.markdown(_HERO_HTML, unsafe_allow_html=True)
+
+    with col2:
+        # Quick stats or quote
+        st.markdown(_QUOTE_HTML, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    _analyze_fragment(analysis_mode, show_highlighting, auto_analyze)
+
 elif page == "📚 Examples":
     st.markdown("""
         <h1 class="main-header">Example Analyses</h1>
         <p class="sub-header">See how different writing styles score</p>
     """, unsafe_allow_html=True)
 
-    examples = [
-        {
-            "title": "Corporate Jargon",
-            "text": "We need to leverage our core competencies to create synergy and move the needle on this game-changing initiative that will disrupt the industry.",
-            "expected": "Low Originality"
-        },
-        {
-            "title": "Data-Driven",
-            "text": "Our Q3 analysis reveals that 73% of users abandoned the checkout process at the payment step (n=1,240). This suggests a friction point costing approximately $2.4M in annual revenue.",
-            "expected": "High Evidence"
-        },
-        {
-            "title": "Hedging Language",
-            "text": "I think that maybe we should probably consider looking into possibly implementing some sort of solution at some point in the future, if that's okay.",
-            "expected": "Low Voice"
-        }
-    ]
-
-    for ex in examples:
+    for ex in _EXAMPLE_ANALYSES:
         with st.expander(f"{ex['title']} ({ex['expected']})"):
             st.markdown(f"**Text:** {ex['text']}")
             if st.button(f"Analyze this example", key=f"btn_{ex['title']}"):
                 st.session_state.text_input = ex['text']
-                st.session_state.analysis_result = st.session_state.analyzer.analyze(ex['text'])
+                st.session_state.analyzed_text = ex['text']
                 st.rerun()
 
 elif page == "ℹ️ About":
-    st.markdown("""
-        <h1 class="main-header">About Dnt Be Average</h1>
-        <div style="max-width: 800px;">
-            <h3 style="color: #6366f1;">The Problem</h3>
-            <p style="color: #cbd5e1; line-height: 1.7;">
-                Large Language Models are trained on billions of texts and predict the most probable next word. 
-                Mathematically, this creates a convergence toward the mean. When everyone uses AI-generated content, 
-                the world drifts toward an "average of averages"—where original thought becomes statistically rare.
-            </p>
-
-            <h3 style="color: #6366f1; margin-top: 2rem;">The Solution</h3>
-            <p style="color: #cbd5e1; line-height: 1.7;">
-                This tool scores your writing on four dimensions that resist convergence:
-            </p>
-            <ul style="color: #cbd5e1; line-height: 1.8;">
-                <li><strong>Originality:</strong> Avoidance of clichés and generic phrases</li>
-                <li><strong>Evidence:</strong> Specific data, examples, and citations</li>
-                <li><strong>Clarity:</strong> Readable structure without unnecessary complexity</li>
-                <li><strong>Voice:</strong> Confidence and distinctive personality</li>
-            </ul>
-
-            <h3 style="color: #6366f1; margin-top: 2rem;">Methodology</h3>
-            <p style="color: #cbd5e1; line-height: 1.7;">
-                The analyzer uses pattern matching for cliché detection, readability metrics for clarity, 
-                and linguistic analysis for voice strength. It runs entirely in your browser (no text is stored 
-                on any server) and is built with Python and Streamlit.
-            </p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_ABOUT_HTML, unsafe_allow_html=True)
@@ -3,26 +3,38 @@ Beautiful metric displays and score visualizations.
 """
 
 import streamlit as st
+from string import Template
+from typing import Optional
 
-def score_gauge(score: float, label: str, color: str = "#6366f1"):
-    """Create a circular score gauge using HTML/CSS"""
-    # Determine color based on score
-    if score >= 80:
-        color = "#10b981"  # Green
-    elif score >= 60:
-        color = "#6366f1"  # Indigo
-    elif score >= 40:
-        color = "#f59e0b"  # Orange
-    else:
-        color = "#f43f5e"  # Red
-
-    html = f"""
+def _score_color(score: int) -> str:
+    if score >= 80: return "#10b981"  # Green
+    elif score >= 60: return "#6366f1"  # Indigo
+    elif score >= 40: return "#f59e0b"  # Orange
+    return "#f43f5e"  # Red
+
+def _grade(score: int):
+    if score >= 90: return "A", "Exceptional", "#10b981"
+    elif score >= 80: return "B", "Strong", "#6366f1"
+    elif score >= 70: return "C", "Average", "#f59e0b"
+    elif score >= 60: return "D", "Below Average", "#f97316"
+    return "F", "Convergent", "#f43f5e"
+
+# Thresholds are whole numbers, so a 0-100 table indexed by int(score) gives the same
+# bands as the >= comparisons; callers pass the raw score and only the lookup truncates
+_COLOR_BY_SCORE = [_score_color(s) for s in range(101)]
+_GRADE_BY_SCORE = [_grade(s) for s in range(101)]
+
+def _band(score: float) -> int:
+    return max(0, min(100, int(score)))
+
+# HTML templates, built once at import and filled per call
+_GAUGE_TPL = Template("""
     <div style="text-align: center; padding: 1rem;">
         <div style="
             width: 140px;
             height: 140px;
             border-radius: 50%;
-            background: conic-gradient({color} {score * 3.6}deg, #1e293b 0deg);
+            background: conic-gradient($color ${arc}deg, #1e293b 0deg);
             display: flex;
             align-items: center;
             justify-content: center;
@@ -43,9 +55,9 @@ def score_gauge(score: float, label: str, color: str = "#6366f1"):
                 <span style="
                     font-size: 2.5rem;
                     font-weight: 800;
-                    color: {color};
+                    color: $color;
                     line-height: 1;
-                ">{score:.0f}</span>
+                ">$score</span>
                 <span style="
                     font-size: 0.75rem;
                     color: #94a3b8;
@@ -62,37 +74,32 @@ def score_gauge(score: float, label: str, color: str = "#6366f1"):
             font-weight: 600;
             text-transform: uppercase;
             letter-spacing: 0.05em;
-        ">{label}</p>
+        ">$label</p>
     </div>
-    """
-    return html
+    """)
 
-def metric_card(title: str, value: str, delta: str = None, status: str = "neutral"):
-    """Create a metric card with status indicator"""
-    colors = {
-        "good": "#10b981",
-        "warning": "#f59e0b", 
-        "bad": "#f43f5e",
-        "neutral": "#6366f1"
-    }
+_STATUS_COLORS = {
+    "good": "#10b981",
+    "warning": "#f59e0b",
+    "bad": "#f43f5e",
+    "neutral": "#6366f1"
+}
 
-    color = colors.get(status, colors["neutral"])
-
-    delta_html = f"""
+_DELTA_TPL = Template("""
         <span style="
-            color: {color};
+            color: $color;
             font-size: 0.875rem;
             font-weight: 600;
-        ">{delta}</span>
-    """ if delta else ""
+        ">$delta</span>
+    """)
 
-    html = f"""
+_METRIC_CARD_TPL = Template("""
     <div style="
         background: rgba(30, 41, 59, 0.6);
         border: 1px solid rgba(148, 163, 184, 0.1);
         border-radius: 12px;
         padding: 1.25rem;
-        border-left: 4px solid {color};
+        border-left: 4px solid $color;
     ">
         <p style="
             color: #94a3b8;
@@ -100,28 +107,71 @@ def metric_card(title: str, value: str, delta: str = None, status: str = "neutra
             margin: 0 0 0.5rem 0;
             text-transform: uppercase;
             letter-spacing: 0.05em;
-        ">{title}</p>
+        ">$title</p>
         <div style="display: flex; align-items: baseline; gap: 0.5rem;">
             <span style="
                 font-size: 1.5rem;
                 font-weight: 700;
                 color: #f8fafc;
-            ">{value}</span>
-            {delta_html}
+            ">$value</span>
+            $delta_html
         </div>
     </div>
-    """
-    return html
+    """)
 
-def score_breakdown(originality: float, evidence: float, clarity: float, voice: float):
-    """Display detailed score breakdown with progress bars"""
+_GRADE_TPL = Template("""
+    <div style="
+        text-align: center;
+        padding: 2rem;
+        background: linear-gradient(135deg, rgba(99, 102, 241, 0.1) 0%, rgba(6, 182, 212, 0.1) 100%);
+        border-radius: 16px;
+        border: 1px solid rgba(99, 102, 241, 0.2);
+    ">
+        <div style="
+            font-size: 4rem;
+            font-weight: 800;
+            color: $color;
+            line-height: 1;
+            margin-bottom: 0.5rem;
+        ">$grade</div>
+        <div style="
+            font-size: 1.25rem;
+            color: #e2e8f0;
+            font-weight: 600;
+        ">$label</div>
+        <div style="
+            color: #94a3b8;
+            font-size: 0.9rem;
+            margin-top: 0.5rem;
+        ">$score/100 overall</div>
+    </div>
+    """)
 
-    def get_color(score):
-        if score >= 80: return "#10b981"
-        elif score >= 60: return "#6366f1"
-        elif score >= 40: return "#f59e0b"
-        return "#f43f5e"
+def score_gauge(score: float, label: str, color: str = "#6366f1"):
+    """Create a circular score gauge using HTML/CSS"""
+    return _render_gauge(score, label)
 
+@st.cache_data(max_entries=512, show_spinner=False)
+def _render_gauge(score: float, label: str) -> str:
+    # Determine color based on score
+    color = _COLOR_BY_SCORE[_band(score)]
+
+    return _GAUGE_TPL.substitute(color=color, arc=score * 3.6, score=f"{score:.0f}", label=label)
+
+def metric_card(title: str, value: str, delta: str = None, status: str = "neutral"):
+    """Create a metric card with status indicator"""
+    color = _STATUS_COLORS.get(status, _STATUS_COLORS["neutral"])
+
+    delta_html = _DELTA_TPL.substitute(color=color, delta=delta) if delta else ""
+
+    return _METRIC_CARD_TPL.substitute(color=color, title=title, value=value, delta_html=delta_html)
+
+def score_breakdown(originality: float, evidence: Optional[float], clarity: Optional[float], voice: float):
+    """Display detailed score breakdown with progress bars; None shows as N/A"""
+    return _render_breakdown(originality, evidence, clarity, voice)
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def _render_breakdown(originality: float, evidence: Optional[float], clarity: Optional[float], voice: float) -> str:
     metrics = [
         ("Originality", originality, "Avoidance of clichés & uniqueness"),
         ("Evidence", evidence, "Data backing & specificity"),
@@ -129,15 +179,19 @@ def score_breakdown(originality: float, evidence: float, clarity: float, voice:
         ("Voice", voice, "Confidence & personality")
     ]
 
-    html = "<div style='space-y: 1rem;'>"
+    parts = ["<div style='space-y: 1rem;'>"]
 
     for label, score, desc in metrics:
-        color = get_color(score)
-        html += f"""
+        if score is None:
+            # Not scored (text too short): muted label and an empty bar
+            color, shown, width = "#64748b", "N/A", 0
+        else:
+            color, shown, width = _COLOR_BY_SCORE[_band(score)], f"{score:.0f}/100", score
+        parts.append(f"""
         <div style="margin-bottom: 1.25rem;">
             <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem;">
                 <span style="color: #e2e8f0; font-weight: 600;">{label}</span>
-                <span style="color: {color}; font-weight: 700;">{score:.0f}/100</span>
+                <span style="color: {color}; font-weight: 700;">{shown}</span>
             </div>
             <div style="
                 width: 100%;
@@ -147,7 +201,7 @@ def score_breakdown(originality: float, evidence: float, clarity: float, voice:
                 overflow: hidden;
             ">
                 <div style="
-                    width: {score}%;
+                    width: {width}%;
                     height: 100%;
                     background: linear-gradient(90deg, {color} 0%, {color}dd 100%);
                     border-radius: 4px;
@@ -160,48 +214,17 @@ def score_breakdown(originality: float, evidence: float, clarity: float, voice:
                 margin: 0.25rem 0 0 0;
             ">{desc}</p>
         </div>
-        """
+        """)
 
-    html += "</div>"
-    return html
+    parts.append("</div>")
+    return "".join(parts)
 
 def overall_grade(score: float):
     """Calculate and display letter grade with interpretation"""
-    if score >= 90:
-        grade, label, color = "A", "Exceptional", "#10b981"
-    elif score >= 80:
-        grade, label, color = "B", "Strong", "#6366f1"
-    elif score >= 70:
-        grade, label, color = "C", "Average", "#f59e0b"
-    elif score >= 60:
-        grade, label, color = "D", "Below Average", "#f97316"
-    else:
-        grade, label, color = "F", "Convergent", "#f43f5e"
-
-    return f"""
-    <div style="
-        text-align: center;
-        padding: 2rem;
-        background: linear-gradient(135deg, rgba(99, 102, 241, 0.1) 0%, rgba(6, 182, 212, 0.1) 100%);
-        border-radius: 16px;
-        border: 1px solid rgba(99, 102, 241, 0.2);
-    ">
-        <div style="
-            font-size: 4rem;
-            font-weight: 800;
-            color: {color};
-            line-height: 1;
-            margin-bottom: 0.5rem;
-        ">{grade}</div>
-        <div style="
-            font-size: 1.25rem;
-            color: #e2e8f0;
-            font-weight: 600;
-        ">{label}</div>
-        <div style="
-            color: #94a3b8;
-            font-size: 0.9rem;
-            margin-top: 0.5rem;
-        ">{score:.1f}/100 overall</div>
-    </div>
-    """
+    return _render_grade(score)
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def _render_grade(score: float) -> str:
+    grade, label, color = _GRADE_BY_SCORE[_band(score)]
+
+    return _GRADE_TPL.substitute(color=color, grade=grade, label=label, score=f"{score:.1f}")
@@ -3,22 +3,219 @@ Core NLP logic for analyzing writing quality.
 Detects clichés, weak claims, and measures originality.
 """
 
+import os
 import re
-from typing import Dict, List, Tuple
+import sys
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
-import textstat
+from functools import lru_cache
+from itertools import chain, repeat
+import ahocorasick
 
-@dataclass
+# Results are frozen and hold tuples: TextAnalyzer memoizes them, so every
+# caller of analyze() on the same text shares one object
+
+@dataclass(frozen=True, slots=True)
+class Issue:
+    text: str
+    start: int
+    end: int
+    type: str
+    severity: str
+
+@dataclass(frozen=True, slots=True)
 class AnalysisResult:
     overall_score: float
     originality_score: float
-    evidence_score: float
-    clarity_score: float
+    evidence_score: Optional[float]  # None when the text is too short to score
+    clarity_score: Optional[float]
     voice_score: float
-    clichés: List[Dict]
-    weak_claims: List[Dict]
-    suggestions: List[str]
-    highlighted_text: str
+    clichés: Tuple[Issue, ...]
+    weak_claims: Tuple[Issue, ...]
+    suggestions: Tuple[str, ...]
+    highlight_spans: Tuple[Tuple[int, int, str], ...]
+
+# Matches patterns of the form \b(phrase|phrase|...)\b
+_ALTERNATION = re.compile(r'^\\b\((.*)\)\\b$')
+_REGEX_META = set('.^$*+?{}[]\\|()')
+
+def _literal_alternatives(pattern: str) -> List[str]:
+    """Return the phrases of a plain \\b(a|b|c)\\b pattern, or [] if it needs a real regex"""
+    match = _ALTERNATION.match(pattern)
+    if not match:
+        return []
+    phrases = match.group(1).split('|')
+    if any(_REGEX_META & set(phrase) for phrase in phrases):
+        return []
+    return [phrase.lower() for phrase in phrases]
+
+def _lower_aligned(text: str, lowered: str) -> str:
+    """Lowercase text without shifting character offsets, given text.lower()"""
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters (e.g. 'İ') expand when lowercased; leave those as-is
+    return ''.join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == '_'
+
+def _on_word_boundaries(text: str, start: int, end: int) -> bool:
+    return (start == 0 or not _is_word_char(text[start - 1])) and \
+           (end == len(text) or not _is_word_char(text[end]))
+
+def _scan_phrases(automaton: ahocorasick.Automaton, lowered: str,
+                  categories: Tuple[str, ...]) -> Dict[str, List[Tuple[int, int]]]:
+    """Find (start, end) spans of whole-word phrases in one pass, keyed by category.
+
+    Each automaton value is a tuple of (group, order, length) entries, where
+    group is (category, pattern index) and order the phrase's position in that
+    pattern's alternation. Overlapping hits within a group are resolved
+    leftmost-first, the same way re.finditer would scan that pattern on its own.
+    """
+    hits = []
+    for last, entries in automaton.iter(lowered):
+        for group, order, length in entries:
+            start = last - length + 1
+            if group[0] in categories and _on_word_boundaries(lowered, start, last + 1):
+                hits.append((start, order, last + 1, group))
+    hits.sort()
+    spans = defaultdict(list)
+    group_end = {}
+    for start, _, end, group in hits:
+        if start >= group_end.get(group, 0):
+            group_end[group] = end
+            spans[group[0]].append((start, end))
+    return spans
+
+# Pattern families scanned for a full analysis, and for a short one
+_ALL_CATEGORIES = ('cliché', 'weak_claim', 'evidence')
+_ISSUE_CATEGORIES = ('cliché', 'weak_claim')
+
+# Readability tokenization
+_WORD_TOKEN = re.compile(r"[^\W_]+(?:'[^\W\d_]+)?")
+_SENTENCE_END = re.compile(r'[.!?]+')
+# Latin vowels with their accented forms, plus Cyrillic; words in scripts without
+# listed vowels still count as one syllable each
+_VOWEL_GROUP = re.compile(r'[aeiouyàáâãäåæèéêëēìíîïòóôõöøœùúûüýÿаеёиоуыэюя]+')
+
+@lru_cache(maxsize=8192)
+def _count_syllables(word: str) -> int:
+    """Estimate syllables from vowel groups, ignoring silent endings"""
+    word = word.lower()
+    count = len(_VOWEL_GROUP.findall(word))
+    if count > 1:
+        if word.endswith('e') and not word.endswith(('le', 'ee')):
+            count -= 1  # make, home
+        elif word.endswith('ed') and not word.endswith(('ted', 'ded')):
+            count -= 1  # abandoned
+        elif word.endswith('es') and not word.endswith(('ses', 'zes', 'xes', 'ces', 'ges', 'ches', 'shes')):
+            count -= 1  # makes
+    return max(1, count)
+
+def _count_sentences(text: str) -> int:
+    text = text.rstrip()
+    count = sum(1 for _ in _SENTENCE_END.finditer(text))
+    # Trailing text without closing punctuation is still a sentence
+    if text and text[-1] not in '.!?':
+        count += 1
+    return max(1, count)
+
+# Score reducers: plain arithmetic over the counts gathered by TextAnalyzer
+
+def _originality_score(n_clichés: int, n_weak: int, n_words: int, n_unique: int, text_len: int) -> float:
+    base_score = 100.0
+    # Deduct for clichés
+    base_score -= n_clichés * 8
+    # Deduct for weak/modifiers
+    base_score -= n_weak * 3
+    # Bonus for unique word ratio
+    unique_ratio = n_unique / n_words if n_words else 0
+    base_score += unique_ratio * 10
+    # Length factor (very short = less original)
+    if text_len < 100:
+        base_score *= 0.8
+    return max(0, min(100, base_score))
+
+def _evidence_score(evidence_hits: int, has_stats: bool, has_citations: bool) -> float:
+    score = 40.0  # Base
+    score += evidence_hits * 8
+    if has_stats:
+        score += 15
+    if has_citations:
+        score += 10
+    return min(100, score)
+
+def _flesch_reading_ease(words: int, sentences: int, syllables: int) -> float:
+    return 206.835 - 1.015 * (words / sentences) - 84.6 * (syllables / words)
+
+def _clarity_score(flesch: float, words: int, sentences: int) -> float:
+    # Normalize to 0-100 (higher is better)
+    normalized = max(0, min(100, flesch))
+    # Penalty for very long sentences
+    avg_words_per_sentence = words / sentences if sentences > 0 else 0
+    if avg_words_per_sentence > 25:
+        normalized -= (avg_words_per_sentence - 25) * 2
+    return max(0, min(100, normalized))
+
+def _voice_score(hedges: int, active_voice: bool, strong_verbs: int) -> float:
+    score = 80.0
+    # Deduct for hedging language
+    score -= hedges * 5
+    # Bonus for active voice indicators
+    if active_voice:
+        score += 10
+    # Bonus for strong verbs
+    score += strong_verbs * 3
+    return min(100, score)
+
+def _score(n_clichés: int, n_weak: int, n_words: int, n_unique: int, text_len: int,
+           evidence_hits: int, has_stats: bool, has_citations: bool,
+           flesch: float, n_tokens: int, n_sentences: int,
+           hedges: int, active_voice: bool, strong_verbs: int) -> Tuple[float, float, float, float, float]:
+    """Reduce the gathered counts to (originality, evidence, clarity, voice, overall)"""
+    originality = _originality_score(n_clichés, n_weak, n_words, n_unique, text_len)
+    evidence = _evidence_score(evidence_hits, has_stats, has_citations)
+    clarity = _clarity_score(flesch, n_tokens, n_sentences) if n_tokens else 70.0
+    voice = _voice_score(hedges, active_voice, strong_verbs)
+    # Weighted overall score
+    overall = originality * 0.3 + evidence * 0.25 + clarity * 0.25 + voice * 0.2
+    return originality, evidence, clarity, voice, overall
+
+# Batches smaller than this run inline; shipping them to worker processes costs more
+_INLINE_BATCH_SIZE = 16
+
+# Process pool shared by every analyze_batch call, started on first use
+_batch_pool = None
+_batch_pool_lock = threading.Lock()
+
+def _get_batch_pool() -> ProcessPoolExecutor:
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is None:
+            _batch_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return _batch_pool
+
+def _discard_batch_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next batch starts a fresh one"""
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is pool:
+            _batch_pool = None
+    pool.shutdown(wait=False)
+
+# One analyzer per class in each worker process, built on first use and kept for
+# the pool's lifetime; keying on the class keeps subclasses' patterns intact
+_worker_analyzers = {}
+
+def _analyze_in_worker(analyzer_cls: type, text: str) -> AnalysisResult:
+    analyzer = _worker_analyzers.get(analyzer_cls)
+    if analyzer is None:
+        analyzer = _worker_analyzers[analyzer_cls] = analyzer_cls()
+    return analyzer.analyze(text)
 
 class TextAnalyzer:
     # Common clichés in business/creative writing
@@ -53,35 +250,93 @@ class TextAnalyzer:
         r"\b(in 20\d{2}|last year|over the past|recently published)\b"
     ]
 
+    # Verbs that earn a voice bonus (matched as word prefixes: build, builder, ...)
+    STRONG_VERBS = ['transform', 'disrupt', 'create', 'build', 'design', 'engineer', 'architect']
+
+    # Opening highlight tag per issue type; the matched text and '</mark>' follow
+    HIGHLIGHT_OPEN = {
+        'cliché': '<mark style="background: #f43f5e40; color: #f43f5e; padding: 2px 4px; border-radius: 4px; font-weight: 600;">',
+        'weak_claim': '<mark style="background: #f59e0b40; color: #f59e0b; padding: 2px 4px; border-radius: 4px; font-weight: 600;">'
+    }
+
     def __init__(self):
-        self.cliché_patterns = [re.compile(p, re.IGNORECASE) for p in self.CLICHÉS]
-        self.weak_patterns = [re.compile(p, re.IGNORECASE) for p in self.WEAK_PATTERNS]
-        self.evidence_patterns = [re.compile(p, re.IGNORECASE) for p in self.EVIDENCE_PATTERNS]
+        # Literal phrases from all three pattern families share one Aho-Corasick
+        # automaton; the few patterns that need a real regex keep their own
+        # consuming scan, so a greedy .* is never re-run from inside an earlier match
+        self.phrase_automaton = ahocorasick.Automaton()
+        # Patterns are all lowercase and run over the lowered text, so no IGNORECASE
+        self.regex_patterns = (self._add_patterns('cliché', self.CLICHÉS)
+                               + self._add_patterns('weak_claim', self.WEAK_PATTERNS)
+                               + self._add_patterns('evidence', self.EVIDENCE_PATTERNS))
+        self.phrase_automaton.make_automaton()
+        # Probes used by the evidence and voice scores
+        self.stats_pattern = re.compile(r'\d+\s*(%|percent|million|billion|thousand)')
+        self.citation_pattern = re.compile(r'\[.*?\]|\(.*?\)|et al\.|\.pdf|http')
+        self.active_voice_pattern = re.compile(r'\b(we|i|our|my)\s+\w+ed\b')
+        self.strong_verb_pattern = re.compile(
+            r'\b(' + '|'.join(self.STRONG_VERBS) + ')'
+        )
+        # Repeat submissions of the same text are answered from a small per-instance
+        # memo; the patterns above are fixed once compiled, so it never goes stale
+        self._analyze_memo = lru_cache(maxsize=32)(self._analyze_text)
+
+    def _add_patterns(self, category: str, patterns: List[str]) -> List[Tuple[str, re.Pattern]]:
+        """Load literal alternations into the automaton; return the rest compiled, with their category"""
+        residual = []
+        for index, p in enumerate(patterns):
+            phrases = _literal_alternatives(p)
+            if not phrases:
+                residual.append((category, re.compile(p)))
+            for order, phrase in enumerate(phrases):
+                entry = ((category, index), order, len(phrase))
+                self.phrase_automaton.add_word(phrase, self.phrase_automaton.get(phrase, ()) + (entry,))
+        return residual
 
     def analyze(self, text: str) -> AnalysisResult:
-        if not text or len(text.strip()) < 20:
-            return AnalysisResult(0, 0, 0, 0, 0, [], [], [], text)
+        return self._analyze_memo(text)
+
+    def analyze_batch(self, texts: List[str]) -> List[AnalysisResult]:
+        """Analyze independent documents in parallel, returning results in input order"""
+        if len(texts) < _INLINE_BATCH_SIZE:
+            return [self.analyze(text) for text in texts]
+        workers = os.cpu_count() or 1
+        # Without a GIL, threads can share this analyzer; otherwise the work goes to
+        # the long-lived process pool, whose workers each keep one analyzer per class
+        if not getattr(sys, '_is_gil_enabled', lambda: True)():
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(self.analyze, texts))
+        pool = _get_batch_pool()
+        try:
+            return list(pool.map(_analyze_in_worker, repeat(type(self), len(texts)), texts,
+                                 chunksize=max(1, len(texts) // (workers * 4))))
+        except BrokenProcessPool:
+            _discard_batch_pool(pool)
+            raise
 
-        # Find issues
-        clichés = self._find_clichés(text)
-        weak_claims = self._find_weak_claims(text)
+    def _analyze_text(self, text: str) -> AnalysisResult:
+        if not text or len(text.strip()) < 20:
+            return AnalysisResult(0, 0, 0, 0, 0, (), (), (), ())
+        if len(text) < 100:
+            return self._analyze_short(text)
 
-        # Calculate scores
-        originality = self._calc_originality(text, clichés, weak_claims)
-        evidence = self._calc_evidence(text)
-        clarity = self._calc_clarity(text)
-        voice = self._calc_voice(text, weak_claims)
+        lowered, folded, spans, clichés, weak_claims = self._find_issues(text, _ALL_CATEGORIES)
+        words = lowered.split()
 
-        # Weighted overall score
-        overall = (originality * 0.3 + evidence * 0.25 + clarity * 0.25 + voice * 0.2)
+        # Gather counts, then reduce them to scores in one call
+        originality, evidence, clarity, voice, overall = _score(
+            len(clichés), len(weak_claims), *self._count_words(words), len(text),
+            len(spans['evidence']), *self._evidence_probes(text, folded),
+            *self._readability(text),
+            *self._voice_probes(folded, weak_claims)
+        )
 
         # Generate suggestions
         suggestions = self._generate_suggestions(
-            text, clichés, weak_claims, originality, evidence, clarity, voice
+            len(words), clichés, weak_claims, originality, evidence, clarity, voice
         )
 
-        # Create highlighted version
-        highlighted = self._highlight_text(text, clichés, weak_claims)
+        # Spans to highlight; HTML is only rendered if the caller asks for it
+        highlight_spans = self._highlight_spans(clichés, weak_claims)
 
         return AnalysisResult(
             overall_score=round(overall, 1),
@@ -92,105 +347,101 @@ class TextAnalyzer:
             clichés=clichés,
             weak_claims=weak_claims,
             suggestions=suggestions,
-            highlighted_text=highlighted
+            highlight_spans=highlight_spans
         )
 
-    def _find_clichés(self, text: str) -> List[Dict]:
-        found = []
-        for i, pattern in enumerate(self.cliché_patterns):
-            for match in pattern.finditer(text):
-                found.append({
-                    'text': match.group(),
-                    'start': match.start(),
-                    'end': match.end(),
-                    'type': 'cliché',
-                    'severity': 'high'
-                })
-        return found
-
-    def _find_weak_claims(self, text: str) -> List[Dict]:
-        found = []
-        for pattern in self.weak_patterns:
-            for match in pattern.finditer(text):
-                found.append({
-                    'text': match.group(),
-                    'start': match.start(),
-                    'end': match.end(),
-                    'type': 'weak_claim',
-                    'severity': 'medium'
-                })
-        return found
-
-    def _calc_originality(self, text: str, clichés: List, weak_claims: List) -> float:
-        base_score = 100.0
-        # Deduct for clichés
-        base_score -= len(clichés) * 8
-        # Deduct for weak/modifiers
-        base_score -= len(weak_claims) * 3
-        # Bonus for unique word ratio
-        words = text.lower().split()
-        unique_ratio = len(set(words)) / len(words) if words else 0
-        base_score += unique_ratio * 10
-        # Length factor (very short = less original)
-        if len(text) < 100:
-            base_score *= 0.8
-        return max(0, min(100, base_score))
-
-    def _calc_evidence(self, text: str) -> float:
-        score = 40.0  # Base
-        for pattern in self.evidence_patterns:
-            matches = len(pattern.findall(text))
-            score += matches * 8
-        # Check for statistics
-        if re.search(r'\d+\s*(%|percent|million|billion|thousand)', text, re.IGNORECASE):
-            score += 15
-        # Check for citations/references
-        if re.search(r'\[.*?\]|\(.*?\)|et al\.|\.pdf|http', text):
-            score += 10
-        return min(100, score)
-
-    def _calc_clarity(self, text: str) -> float:
-        try:
-            # Readability scores (lower is easier)
-            flesch = textstat.flesch_reading_ease(text)
-            # Normalize to 0-100 (higher is better)
-            normalized = max(0, min(100, flesch))
-            # Penalty for very long sentences
-            sentences = textstat.sentence_count(text)
-            words = textstat.lexicon_count(text)
-            avg_words_per_sentence = words / sentences if sentences > 0 else 0
-            if avg_words_per_sentence > 25:
-                normalized -= (avg_words_per_sentence - 25) * 2
-            return max(0, min(100, normalized))
-        except:
-            return 70.0
-
-    def _calc_voice(self, text: str, weak_claims: List) -> float:
-        score = 80.0
-        # Deduct for hedging language
-        score -= len([w for w in weak_claims if w['type'] == 'weak_claim']) * 5
-        # Bonus for active voice indicators
-        if re.search(r'\b(we|i|our|my)\s+\w+ed\b', text, re.IGNORECASE):
-            score += 10
-        # Bonus for strong verbs
-        strong_verbs = ['transform', 'disrupt', 'create', 'build', 'design', 'engineer', 'architect']
-        for verb in strong_verbs:
-            if re.search(rf'\b{verb}', text, re.IGNORECASE):
-                score += 3
-        return min(100, score)
-
-    def _generate_suggestions(self, text: str, clichés: List, weak_claims: List, 
-                             orig: float, evid: float, clar: float, voice: float) -> List[str]:
+    def _analyze_short(self, text: str) -> AnalysisResult:
+        """Reduced report for short snippets: issues, originality and voice only"""
+        # Evidence and readability mean little on a sentence or two, so the
+        # evidence patterns are not scanned and those scores are left unset
+        lowered, folded, spans, clichés, weak_claims = self._find_issues(text, _ISSUE_CATEGORIES)
+        words = lowered.split()
+
+        # Unscanned evidence and readability enter the overall score at their
+        # baselines (no hits: 40; no tokens: 70), so grades stay on the long-text scale
+        originality, _, _, voice, overall = _score(
+            len(clichés), len(weak_claims), *self._count_words(words), len(text),
+            0, False, False,
+            0.0, 0, 0,
+            *self._voice_probes(folded, weak_claims)
+        )
+
+        return AnalysisResult(
+            overall_score=round(overall, 1),
+            originality_score=round(originality, 1),
+            evidence_score=None,
+            clarity_score=None,
+            voice_score=round(voice, 1),
+            clichés=clichés,
+            weak_claims=weak_claims,
+            suggestions=self._generate_suggestions(
+                len(words), clichés, weak_claims, originality, None, None, voice
+            ),
+            highlight_spans=self._highlight_spans(clichés, weak_claims)
+        )
+
+    def _find_issues(self, text: str, categories: Tuple[str, ...]
+                     ) -> Tuple[str, str, Dict[str, List[Tuple[int, int]]], Tuple[Issue, ...], Tuple[Issue, ...]]:
+        """Lowercase text once and scan it, returning (lowered, folded, spans, clichés, weak claims)"""
+        # Matching runs on the offset-aligned copy so spans index straight into text
+        lowered = text.lower()
+        folded = _lower_aligned(text, lowered)
+        spans = self._scan(folded, categories)
+        clichés = self._to_issues(text, spans['cliché'], 'cliché', 'high')
+        weak_claims = self._to_issues(text, spans['weak_claim'], 'weak_claim', 'medium')
+        return lowered, folded, spans, clichés, weak_claims
+
+    def _scan(self, folded: str, categories: Tuple[str, ...]) -> Dict[str, List[Tuple[int, int]]]:
+        """Match the given pattern families over the lowered text, returning (start, end) spans keyed by category"""
+        spans = _scan_phrases(self.phrase_automaton, folded, categories)
+        for category, pattern in self.regex_patterns:
+            if category in categories:
+                spans[category].extend(match.span() for match in pattern.finditer(folded))
+        return spans
+
+    def _to_issues(self, text: str, spans: List[Tuple[int, int]], kind: str, severity: str) -> Tuple[Issue, ...]:
+        return tuple(Issue(text[start:end], start, end, kind, severity) for start, end in sorted(spans))
+
+    def _count_words(self, words: List[str]) -> Tuple[int, int]:
+        """(words, distinct words) of the shared word list"""
+        return len(words), len(set(words))
+
+    def _evidence_probes(self, text: str, folded: str) -> Tuple[bool, bool]:
+        """(has statistics, has citations/references)"""
+        has_stats = self.stats_pattern.search(folded) is not None
+        # Citations stay case-sensitive ('HTTP' or 'ET AL.' don't count)
+        has_citations = self.citation_pattern.search(text) is not None
+        return has_stats, has_citations
+
+    def _readability(self, text: str) -> Tuple[float, int, int]:
+        """(Flesch reading ease, words, sentences) from a single tokenization"""
+        words = _WORD_TOKEN.findall(text)
+        if not words:
+            return 0.0, 0, 0
+        sentences = _count_sentences(text)
+        syllables = sum(_count_syllables(w) for w in words)
+        return _flesch_reading_ease(len(words), sentences, syllables), len(words), sentences
+
+    def _voice_probes(self, folded: str, weak_claims: Tuple[Issue, ...]) -> Tuple[int, bool, int]:
+        """(hedges, active voice present, distinct strong verbs), probed on the lowered text"""
+        hedges = sum(1 for w in weak_claims if w.type == 'weak_claim')
+        active = self.active_voice_pattern.search(folded) is not None
+        # Strong verbs, each counted once however often it appears
+        strong_hits = len(set(self.strong_verb_pattern.findall(folded)))
+        return hedges, active, strong_hits
+
+    def _generate_suggestions(self, n_words: int, clichés: Tuple[Issue, ...], weak_claims: Tuple[Issue, ...], 
+                             orig: float, evid: Optional[float], clar: Optional[float], voice: float) -> Tuple[str, ...]:
         suggestions = []
 
         if clichés:
-            unique_clichés = list(set([c['text'] for c in clichés]))[:3]
+            unique_clichés = list(dict.fromkeys(c.text for c in clichés))[:3]
             suggestions.append(f"Replace clichés like '{unique_clichés[0]}' with specific details")
 
-        if evid < 60:
+        if evid is not None and evid < 60:
             suggestions.append("Add specific data, examples, or citations to strengthen claims")
 
-        if clar < 60:
+        if clar is not None and clar < 60:
             suggestions.append("Break long sentences into shorter, punchier statements")
 
         if voice < 60:
@@ -199,23 +450,37 @@ class TextAnalyzer:
         if orig < 50:
             suggestions.append("Add unexpected metaphors or personal anecdotes to stand out")
 
-        if len(text.split()) < 50:
+        if n_words < 50:
             suggestions.append("Expand with more specific details—shallow content averages out")
 
-        return suggestions if suggestions else ["Great work! Your writing shows distinctive voice and depth."]
+        return tuple(suggestions) if suggestions else ("Great work! Your writing shows distinctive voice and depth.",)
 
-    def _highlight_text(self, text: str, clichés: List, weak_claims: List) -> str:
+    def _highlight_spans(self, clichés: Tuple[Issue, ...], weak_claims: Tuple[Issue, ...]) -> Tuple[Tuple[int, int, str], ...]:
+        """Non-overlapping (start, end, type) spans to highlight, in text order"""
+        # Sort by position; on ties prefer the longer span, then clichés over weak claims.
+        # The tuples themselves are the sort key, so no Python key function runs per item
+        issues = sorted(
+            (issue.start, -issue.end, issue.type != 'cliché', issue.type)
+            for issue in chain(clichés, weak_claims)
+        )
+
+        spans = []
+        cursor = 0
+        for start, neg_end, _, kind in issues:
+            if start < cursor:
+                continue  # overlaps (or repeats) a span that is already highlighted
+            spans.append((start, -neg_end, kind))
+            cursor = -neg_end
+        return tuple(spans)
+
+    def highlight_text(self, text: str, spans: Tuple[Tuple[int, int, str], ...]) -> str:
         """Create HTML highlighted version of text"""
-        # Sort by position in reverse to avoid offset issues
-        all_issues = sorted(clichés + weak_claims, key=lambda x: x['start'], reverse=True)
-
-        result = text
-        for issue in all_issues:
-            start, end = issue['start'], issue['end']
-            snippet = text[start:end]
-            css_class = 'cliche-highlight' if issue['type'] == 'cliché' else 'weak-highlight'
-            color = '#f43f5e' if issue['type'] == 'cliché' else '#f59e0b'
-            replacement = f'<mark style="background: {color}40; color: {color}; padding: 2px 4px; border-radius: 4px; font-weight: 600;">{snippet}</mark>'
-            result = result[:start] + replacement + result[end:]
-
-        return result
+        opening = self.HIGHLIGHT_OPEN
+        parts = []
+        cursor = 0
+        for start, end, kind in spans:
+            parts += (text[cursor:start], opening[kind], text[start:end], '</mark>')
+            cursor = end
+        parts.append(text[cursor:])
+
+        return ''.join(parts)